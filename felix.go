@@ -222,10 +222,11 @@ configRetry:
 				FailsafeInboundHostPorts:  configParams.FailsafeInboundHostPorts,
 				FailsafeOutboundHostPorts: configParams.FailsafeOutboundHostPorts,
 			},
-			IPIPMTU:                 configParams.IpInIpMtu,
-			IptablesRefreshInterval: time.Duration(configParams.IptablesRefreshInterval) * time.Second,
-			IptablesInsertMode:      configParams.ChainInsertMode,
-			MaxIPSetSize:            configParams.MaxIpsetSize,
+			IPIPMTU:                   configParams.IpInIpMtu,
+			IptablesRefreshInterval:   time.Duration(configParams.IptablesRefreshInterval) * time.Second,
+			IptablesInsertMode:        configParams.ChainInsertMode,
+			MaxIPSetSize:              configParams.MaxIpsetSize,
+			HostInterfacePollInterval: time.Duration(configParams.HostInterfacePollInterval) * time.Second,
 		}
 		intDP := intdataplane.NewIntDataplaneDriver(dpConfig)
 		intDP.Start()
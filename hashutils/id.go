@@ -19,7 +19,11 @@ import (
 	"encoding/base64"
 )
 
-const shortenedPrefix = "_"
+const (
+	shortenedPrefix = "_"
+	// hashEncodedLen is the length of a base64-encoded (without padding) SHA-256 hash.
+	hashEncodedLen = 43
+)
 
 // GetLengthLimitedID returns an ID that consists of the given prefix and, either the given suffix,
 // or, if that would exceed the length limit, a cryptographic hash of the suffix, truncated to the
@@ -28,15 +32,17 @@ func GetLengthLimitedID(fixedPrefix, suffix string, maxLength int) string {
 	prefixLen := len(fixedPrefix)
 	suffixLen := len(suffix)
 	totalLen := prefixLen + suffixLen
-	if totalLen > maxLength || (totalLen == maxLength && suffix[0:1] == shortenedPrefix) {
+	if totalLen > maxLength || (totalLen == maxLength && suffixLen > 0 && suffix[0] == shortenedPrefix[0]) {
 		// Either it's just too long, or it's exactly the right length but it happens to
 		// start with the character that we use to denote a shortened string, which could
-		// result in a clash.  Hash the value and truncate...
-		hasher := sha256.New()
-		hasher.Write([]byte(suffix))
-		hash := base64.RawURLEncoding.EncodeToString(hasher.Sum(nil))
+		// result in a clash.  Hash the value and truncate...  This is called for every
+		// chain name that we render so we hash and encode into fixed-size arrays rather
+		// than going via a hash.Hash and an intermediate string.
+		sum := sha256.Sum256([]byte(suffix))
+		var hash [hashEncodedLen]byte
+		base64.RawURLEncoding.Encode(hash[:], sum[:])
 		charsLeftForHash := maxLength - 1 - prefixLen
-		return fixedPrefix + shortenedPrefix + hash[0:charsLeftForHash]
+		return fixedPrefix + shortenedPrefix + string(hash[0:charsLeftForHash])
 	}
 	// No need to shorten.
 	return fixedPrefix + suffix
@@ -28,6 +28,9 @@ var _ = Describe("Id", func() {
 	It("should return the suffix if exact length without _ prefix", func() {
 		Expect(GetLengthLimitedID("felix", "123456", 11)).To(Equal("felix123456"))
 	})
+	It("should return the prefix if the suffix is empty and the prefix is exactly the limit", func() {
+		Expect(GetLengthLimitedID("felix", "", 5)).To(Equal("felix"))
+	})
 	It("should return the hash if exact length with _ prefix", func() {
 		Expect(GetLengthLimitedID("felix", "_2345", 10)).To(Equal("felix_kMQI"))
 	})
@@ -53,10 +53,19 @@ type InterfaceMonitor struct {
 	ifaceAddrs   map[int]set.Set
 }
 
-func New() *InterfaceMonitor {
-	// Interface monitor using the real netlink, and resyncing every 10 seconds.
-	resyncTicker := time.NewTicker(10 * time.Second)
-	return NewWithStubs(&netlinkReal{}, resyncTicker.C)
+// New creates an interface monitor using the real netlink.  Interface changes are picked
+// up from the netlink subscription; in addition, the monitor resyncs with a full listing
+// every resyncInterval, or never if resyncInterval is 0.
+func New(resyncInterval time.Duration) *InterfaceMonitor {
+	var resyncC <-chan time.Time
+	if resyncInterval > 0 {
+		resyncTicker := time.NewTicker(resyncInterval)
+		resyncC = resyncTicker.C
+	} else {
+		log.Info("Interface resync disabled, relying on netlink updates only.  Interface " +
+			"addresses will be re-listed on every link update.")
+	}
+	return NewWithStubs(&netlinkReal{}, resyncC)
 }
 
 func NewWithStubs(netlinkStub netlinkStub, resyncC <-chan time.Time) *InterfaceMonitor {
@@ -89,21 +98,28 @@ func (m *InterfaceMonitor) MonitorInterfaces() {
 
 readLoop:
 	for {
-		log.WithFields(log.Fields{
-			"updates":     updates,
-			"addrUpdates": addrUpdates,
-			"resyncC":     m.resyncC,
-		}).Debug("About to select on possible triggers")
+		debug := log.GetLevel() >= log.DebugLevel
+		if debug {
+			log.WithFields(log.Fields{
+				"updates":     updates,
+				"addrUpdates": addrUpdates,
+				"resyncC":     m.resyncC,
+			}).Debug("About to select on possible triggers")
+		}
 		select {
 		case update, ok := <-updates:
-			log.WithField("update", update).Debug("Link update")
+			if debug {
+				log.WithField("update", update).Debug("Link update")
+			}
 			if !ok {
 				log.Warn("Failed to read a link update")
 				break readLoop
 			}
 			m.handleNetlinkUpdate(update)
 		case addrUpdate, ok := <-addrUpdates:
-			log.WithField("addrUpdate", addrUpdate).Debug("Address update")
+			if debug {
+				log.WithField("addrUpdate", addrUpdate).Debug("Address update")
+			}
 			if !ok {
 				log.Warn("Failed to read an address update")
 				break readLoop
@@ -129,7 +145,10 @@ func (m *InterfaceMonitor) handleNetlinkUpdate(update netlink.LinkUpdate) {
 	}
 	msgType := update.Header.Type
 	ifaceExists := msgType == syscall.RTM_NEWLINK // Alternative is an RTM_DELLINK
-	m.storeAndNotifyLink(ifaceExists, update.Link)
+	// If periodic resync is disabled, nothing else would correct our picture of a known
+	// link's addresses if we miss an address update, so re-list them on each link update.
+	forceAddrRefresh := m.resyncC == nil
+	m.storeAndNotifyLink(ifaceExists, update.Link, forceAddrRefresh)
 }
 
 func (m *InterfaceMonitor) handleNetlinkAddrUpdate(update netlink.AddrUpdate) {
@@ -187,16 +206,24 @@ func (m *InterfaceMonitor) notifyIfaceAddrs(ifIndex int) {
 	}
 }
 
-func (m *InterfaceMonitor) storeAndNotifyLink(ifaceExists bool, link netlink.Link) {
-	log.WithFields(log.Fields{
-		"ifaceExists": ifaceExists,
-		"link":        link,
-	}).Debug("storeAndNotifyLink")
+// storeAndNotifyLink stores the state of the given link and makes any necessary callbacks.  If
+// forceAddrRefresh is false, the link's addresses are only listed if the link is new to us; for
+// links we already know about, the address update channel keeps us in sync.
+func (m *InterfaceMonitor) storeAndNotifyLink(ifaceExists bool, link netlink.Link, forceAddrRefresh bool) {
+	if log.GetLevel() >= log.DebugLevel {
+		log.WithFields(log.Fields{
+			"ifaceExists":      ifaceExists,
+			"link":             link,
+			"forceAddrRefresh": forceAddrRefresh,
+		}).Debug("storeAndNotifyLink")
+	}
 
 	// Store or remove mapping between this interface's index and name.
 	attrs := link.Attrs()
 	ifIndex := attrs.Index
 	ifaceName := attrs.Name
+	oldName, linkWasKnown := m.ifaceName[ifIndex]
+	linkWasKnown = linkWasKnown && oldName == ifaceName
 	if ifaceExists {
 		m.ifaceName[ifIndex] = ifaceName
 	} else {
@@ -230,7 +257,13 @@ func (m *InterfaceMonitor) storeAndNotifyLink(ifaceExists bool, link netlink.Lin
 	// channels.  We deliberately do this regardless of the link state, as in some cases this
 	// will allow us to secure a Host Endpoint interface _before_ it comes up, and so eliminate
 	// a small window of insecurity.
-	if ifaceExists {
+	//
+	// Once we know about a link, any subsequent address changes are reported via the address
+	// update channel so there's no need to list the addresses again on every link update
+	// (which can be frequent, for example, as the link flaps or its stats change).  We still
+	// list them on resync in case we missed an update; if resync is disabled, the caller
+	// forces a refresh on every link update instead.
+	if ifaceExists && (forceAddrRefresh || !linkWasKnown) {
 		newAddrs := set.New()
 		for _, family := range [2]int{netlink.FAMILY_V4, netlink.FAMILY_V6} {
 			addrs, err := m.netlinkStub.AddrList(link, family)
@@ -265,7 +298,7 @@ func (m *InterfaceMonitor) resync() error {
 			continue
 		}
 		currentIfaces.Add(attrs.Name)
-		m.storeAndNotifyLink(true, link)
+		m.storeAndNotifyLink(true, link, true)
 	}
 	m.upIfaces.Iter(func(name interface{}) error {
 		if currentIfaces.Contains(name) {
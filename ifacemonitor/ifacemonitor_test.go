@@ -41,10 +41,11 @@ type netlinkTest struct {
 	addrUpdates    chan netlink.AddrUpdate
 	userSubscribed chan int
 
-	nextIndex int
-	links     map[string]linkModel
+	nextIndex        int
+	links            map[string]linkModel
+	numAddrListCalls int
 
-	// Mutex protecting the two items above.  Note that in many cases we unlock as soon as
+	// Mutex protecting the three items above.  Note that in many cases we unlock as soon as
 	// possible after we've read and/or written that data - instead of using defer - because we
 	// don't want to hold the mutex when writing to a channel (which is often what happens next
 	// in the same function).
@@ -210,6 +211,7 @@ func (nl *netlinkTest) AddrList(link netlink.Link, family int) ([]netlink.Addr,
 	name := link.Attrs().Name
 	nl.linksMutex.Lock()
 	defer nl.linksMutex.Unlock()
+	nl.numAddrListCalls++
 	model, prs := nl.links[name]
 	addrs := []netlink.Addr{}
 	if prs {
@@ -238,6 +240,12 @@ func (nl *netlinkTest) AddrList(link netlink.Link, family int) ([]netlink.Addr,
 	return addrs, nil
 }
 
+func (nl *netlinkTest) getNumAddrListCalls() int {
+	nl.linksMutex.Lock()
+	defer nl.linksMutex.Unlock()
+	return nl.numAddrListCalls
+}
+
 func (dp *mockDataplane) linkStateCallback(ifaceName string, ifaceState ifacemonitor.State) {
 	log.Info("linkStateCallback: ifaceName=", ifaceName)
 	log.Info("linkStateCallback: ifaceState=", ifaceState)
@@ -292,17 +300,26 @@ func (dp *mockDataplane) expectAddrStateCb(ifaceName string, addr string, presen
 var _ = Describe("ifacemonitor", func() {
 	var nl *netlinkTest
 	var resyncC chan time.Time
+	var resyncDisabled bool
 	var im *ifacemonitor.InterfaceMonitor
 	var dp *mockDataplane
 
 	BeforeEach(func() {
-		// Make an Interface Monitor that uses a test netlink stub implementation and resync
-		// trigger channel - both controlled by this code.
 		nl = &netlinkTest{
 			userSubscribed: make(chan int),
 		}
 		resyncC = make(chan time.Time)
-		im = ifacemonitor.NewWithStubs(nl, resyncC)
+		resyncDisabled = false
+	})
+
+	JustBeforeEach(func() {
+		// Make an Interface Monitor that uses a test netlink stub implementation and resync
+		// trigger channel - both controlled by this code.
+		if resyncDisabled {
+			im = ifacemonitor.NewWithStubs(nl, nil)
+		} else {
+			im = ifacemonitor.NewWithStubs(nl, resyncC)
+		}
 
 		// Register this test code's callbacks, which (a) log; and (b) send to a 1- or
 		// 2-buffered channel, so that the test code _must_ explicitly indicate when it
@@ -383,4 +400,48 @@ var _ = Describe("ifacemonitor", func() {
 		resyncC <- time.Time{}
 		resyncC <- time.Time{}
 	})
+
+	It("should only re-list a known link's addresses on resync", func() {
+		// Adding the link lists its addresses.  We use address updates as barriers: once
+		// we've had the address callback, the monitor has finished processing any earlier
+		// link updates.
+		nl.addLink("eth0")
+		nl.addAddr("eth0", "10.0.240.10/24")
+		dp.expectAddrStateCb("eth0", "10.0.240.10", true)
+		numCalls := nl.getNumAddrListCalls()
+
+		// Flap the link.  The link is known, so its addresses should not be re-listed.
+		nl.changeLinkState("eth0", "up")
+		dp.expectLinkStateCb("eth0")
+		nl.changeLinkState("eth0", "down")
+		dp.expectLinkStateCb("eth0")
+		nl.addAddr("eth0", "172.19.34.1/27")
+		dp.expectAddrStateCb("eth0", "172.19.34.1", true)
+		Expect(nl.getNumAddrListCalls()).To(Equal(numCalls))
+
+		// A resync should re-list the addresses, once for each IP family.
+		resyncC <- time.Time{}
+		nl.addAddr("eth0", "172.19.35.1/27")
+		dp.expectAddrStateCb("eth0", "172.19.35.1", true)
+		Expect(nl.getNumAddrListCalls()).To(Equal(numCalls + 2))
+	})
+
+	Context("with resync disabled", func() {
+		BeforeEach(func() {
+			resyncDisabled = true
+		})
+
+		It("should re-list a known link's addresses on each link update", func() {
+			nl.addLink("eth0")
+			nl.addAddr("eth0", "10.0.240.10/24")
+			dp.expectAddrStateCb("eth0", "10.0.240.10", true)
+			numCalls := nl.getNumAddrListCalls()
+
+			nl.changeLinkState("eth0", "up")
+			dp.expectLinkStateCb("eth0")
+			nl.addAddr("eth0", "172.19.34.1/27")
+			dp.expectAddrStateCb("eth0", "172.19.34.1", true)
+			Expect(nl.getNumAddrListCalls()).To(Equal(numCalls + 2))
+		})
+	})
 })
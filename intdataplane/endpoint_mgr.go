@@ -177,7 +177,9 @@ func newEndpointManagerWithShims(
 }
 
 func (m *endpointManager) OnUpdate(protoBufMsg interface{}) {
-	log.WithField("msg", protoBufMsg).Debug("Received message")
+	if log.GetLevel() >= log.DebugLevel {
+		log.WithField("msg", protoBufMsg).Debug("Received message")
+	}
 	switch msg := protoBufMsg.(type) {
 	case *proto.WorkloadEndpointUpdate:
 		m.pendingWlEpUpdates[*msg.Id] = msg.Endpoint
@@ -359,8 +361,9 @@ func (m *endpointManager) calculateHostEndpointStatus(id proto.HostEndpointID) (
 
 func (m *endpointManager) resolveWorkloadEndpoints() {
 	// Optimisation, only recalculate the dispatch chains if we've never done so or if the
-	// workloads have changed in some way.
-	needToCheckDispatchChains := m.activeDispatchChains == nil || len(m.pendingWlEpUpdates) > 0
+	// set of workload interface names has changed.  The dispatch chains only depend on the
+	// interface names so updates to existing endpoints can't change them.
+	needToCheckDispatchChains := m.activeDispatchChains == nil
 
 	// Update any dirty endpoints.
 	for id, workload := range m.pendingWlEpUpdates {
@@ -375,6 +378,10 @@ func (m *endpointManager) resolveWorkloadEndpoints() {
 				m.wlIfaceNamesToReconfigure.Discard(oldWorkload.Name)
 				delete(m.activeWlIfaceNameToID, oldWorkload.Name)
 			}
+			newIfaceName := oldWorkload == nil || oldWorkload.Name != workload.Name
+			if newIfaceName {
+				needToCheckDispatchChains = true
+			}
 			chains := m.ruleRenderer.WorkloadEndpointToIptablesChains(&id, workload)
 			m.filterTable.UpdateChains(chains)
 			m.activeWlIDToChains[id] = chains
@@ -421,7 +428,13 @@ func (m *endpointManager) resolveWorkloadEndpoints() {
 				}
 			}
 			m.routeTable.SetRoutes(workload.Name, routeTargets)
-			m.wlIfaceNamesToReconfigure.Add(workload.Name)
+			if newIfaceName {
+				// New interface, make sure its /proc/sys config is applied.  For
+				// updates to an existing endpoint the interface config is unchanged
+				// so there's no need to rewrite it; if the interface flaps, the
+				// interface update will trigger reconfiguration.
+				m.wlIfaceNamesToReconfigure.Add(workload.Name)
+			}
 			m.activeWlEndpoints[id] = workload
 			m.activeWlIfaceNameToID[workload.Name] = id
 			delete(m.pendingWlEpUpdates, id)
@@ -435,6 +448,7 @@ func (m *endpointManager) resolveWorkloadEndpoints() {
 				m.routeTable.SetRoutes(oldWorkload.Name, nil)
 				m.wlIfaceNamesToReconfigure.Discard(oldWorkload.Name)
 				delete(m.activeWlIfaceNameToID, oldWorkload.Name)
+				needToCheckDispatchChains = true
 			}
 			delete(m.activeWlEndpoints, id)
 			delete(m.pendingWlEpUpdates, id)
@@ -449,8 +463,7 @@ func (m *endpointManager) resolveWorkloadEndpoints() {
 		newDispatchChains := m.ruleRenderer.WorkloadDispatchChains(m.activeWlEndpoints)
 		if !reflect.DeepEqual(newDispatchChains, m.activeDispatchChains) {
 			log.Info("Workloads changed, updating dispatch chains.")
-			m.filterTable.RemoveChains(m.activeDispatchChains)
-			m.filterTable.UpdateChains(newDispatchChains)
+			updateDispatchChains(m.filterTable, m.activeDispatchChains, newDispatchChains)
 			m.activeDispatchChains = newDispatchChains
 		}
 	}
@@ -636,8 +649,7 @@ func (m *endpointManager) resolveHostEndpoints() {
 	newFiltDispatchChains := m.ruleRenderer.HostDispatchChains(newIfaceNameToHostEpID)
 	if !reflect.DeepEqual(newFiltDispatchChains, m.activeHostFiltDispatchChains) {
 		log.Info("HostEps changed, updating filter dispatch chains.")
-		m.filterTable.RemoveChains(m.activeHostFiltDispatchChains)
-		m.filterTable.UpdateChains(newFiltDispatchChains)
+		updateDispatchChains(m.filterTable, m.activeHostFiltDispatchChains, newFiltDispatchChains)
 		m.activeHostFiltDispatchChains = newFiltDispatchChains
 	}
 
@@ -645,13 +657,30 @@ func (m *endpointManager) resolveHostEndpoints() {
 	newRawDispatchChains := m.ruleRenderer.HostDispatchChains(newUntrackedIfaceNameToHostEpID)
 	if !reflect.DeepEqual(newRawDispatchChains, m.activeHostRawDispatchChains) {
 		log.Info("HostEps changed, updating raw dispatch chains.")
-		m.rawTable.RemoveChains(m.activeHostRawDispatchChains)
-		m.rawTable.UpdateChains(newRawDispatchChains)
+		updateDispatchChains(m.rawTable, m.activeHostRawDispatchChains, newRawDispatchChains)
 		m.activeHostRawDispatchChains = newRawDispatchChains
 	}
 	log.Debug("Done resolving host endpoints.")
 }
 
+// updateDispatchChains replaces oldChains with newChains in the given table.  Adding an endpoint
+// typically only changes one or two of the dispatch chains so, rather than removing all the old
+// chains and re-adding the new ones, which would force every chain to be rewritten, we only
+// remove the chains that are no longer needed.  The table ignores updates to chains that
+// haven't changed, so only the modified chains get written to the dataplane.
+func updateDispatchChains(table iptablesTable, oldChains, newChains []*iptables.Chain) {
+	newChainNames := set.New()
+	for _, chain := range newChains {
+		newChainNames.Add(chain.Name)
+	}
+	for _, chain := range oldChains {
+		if !newChainNames.Contains(chain.Name) {
+			table.RemoveChainByName(chain.Name)
+		}
+	}
+	table.UpdateChains(newChains)
+}
+
 func (m *endpointManager) configureInterface(name string) error {
 	if !m.activeUpIfaces.Contains(name) {
 		log.WithField("ifaceName", name).Info(
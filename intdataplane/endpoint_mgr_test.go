@@ -297,6 +297,20 @@ func (r *statusReportRecorder) endpointStatusUpdateCallback(ipVersion uint8, id
 	}
 }
 
+// countingRenderer wraps a RuleRenderer, counting the number of times that the workload
+// dispatch chains are calculated.
+type countingRenderer struct {
+	rules.RuleRenderer
+	numWlDispatchCalcs int
+}
+
+func (r *countingRenderer) WorkloadDispatchChains(
+	endpoints map[proto.WorkloadEndpointID]*proto.WorkloadEndpoint,
+) []*iptables.Chain {
+	r.numWlDispatchCalcs++
+	return r.RuleRenderer.WorkloadDispatchChains(endpoints)
+}
+
 type hostEpSpec struct {
 	id        string
 	name      string
@@ -314,6 +328,7 @@ func endpointManagerTests(ipVersion uint8) func() {
 		)
 		var (
 			epMgr           *endpointManager
+			renderer        *countingRenderer
 			rawTable        *mockTable
 			filterTable     *mockTable
 			rrConfigNormal  rules.Config
@@ -345,7 +360,7 @@ func endpointManagerTests(ipVersion uint8) func() {
 		})
 
 		JustBeforeEach(func() {
-			renderer := rules.NewRenderer(rrConfigNormal)
+			renderer = &countingRenderer{RuleRenderer: rules.NewRenderer(rrConfigNormal)}
 			rawTable = newMockTable("raw")
 			filterTable = newMockTable("filter")
 			routeTable = &mockRouteTable{
@@ -498,6 +513,12 @@ func endpointManagerTests(ipVersion uint8) func() {
 					Context("with the first host ep removed", func() {
 						JustBeforeEach(removeHostEp("id1"))
 						It("should have expected chains", expectChainsFor("eth0_tierB"))
+						It("should not have removed the host dispatch chains", func() {
+							for _, table := range []*mockTable{filterTable, rawTable} {
+								Expect(table.RemovedChains.Contains("cali-to-host-endpoint")).To(BeFalse())
+								Expect(table.RemovedChains.Contains("cali-from-host-endpoint")).To(BeFalse())
+							}
+						})
 						It("should report id2 up only", func() {
 							Expect(statusReportRec.currentState).To(Equal(map[interface{}]string{
 								proto.HostEndpointID{EndpointId: "id2"}: "up",
@@ -931,6 +952,10 @@ func endpointManagerTests(ipVersion uint8) func() {
 
 					Context("with floating IPs added to the endpoint", func() {
 						JustBeforeEach(func() {
+							// Reset the /proc/sys state and the renderer's counter so we can
+							// check that the update doesn't redo per-interface work.
+							mockProcSys.state = map[string]string{}
+							renderer.numWlDispatchCalcs = 0
 							epMgr.OnUpdate(&proto.WorkloadEndpointUpdate{
 								Id: &wlEPID1,
 								Endpoint: &proto.WorkloadEndpoint{
@@ -956,6 +981,14 @@ func endpointManagerTests(ipVersion uint8) func() {
 
 						It("should have expected chains", expectWlChainsFor("cali12345-ab"))
 
+						It("should not rewrite /proc/sys entries", func() {
+							mockProcSys.checkState(map[string]string{})
+						})
+
+						It("should not recalculate the dispatch chains", func() {
+							Expect(renderer.numWlDispatchCalcs).To(BeZero())
+						})
+
 						It("should set routes", func() {
 							if ipVersion == 6 {
 								routeTable.checkRoutes("cali12345-ab", []routetable.Target{
@@ -993,6 +1026,8 @@ func endpointManagerTests(ipVersion uint8) func() {
 
 					Context("with the endpoint removed", func() {
 						JustBeforeEach(func() {
+							renderer.numWlDispatchCalcs = 0
+							filterTable.RemovedChains = set.New()
 							epMgr.OnUpdate(&proto.WorkloadEndpointRemove{
 								Id: &wlEPID1,
 							})
@@ -1001,6 +1036,17 @@ func endpointManagerTests(ipVersion uint8) func() {
 
 						It("should have empty dispatch chains", expectEmptyChains())
 
+						It("should recalculate the dispatch chains", func() {
+							Expect(renderer.numWlDispatchCalcs).To(Equal(1))
+						})
+
+						It("should only remove the endpoint's own chains", func() {
+							Expect(filterTable.RemovedChains).To(Equal(set.From(
+								"calitw-cali12345-ab",
+								"califw-cali12345-ab",
+							)))
+						})
+
 						It("should have removed routes", func() {
 							routeTable.checkRoutes("cali12345-ab", nil)
 						})
@@ -1009,8 +1055,92 @@ func endpointManagerTests(ipVersion uint8) func() {
 						})
 					})
 
+					Context("with two more endpoints that share a dispatch prefix", func() {
+						wlEPID2 := proto.WorkloadEndpointID{
+							OrchestratorId: "k8s",
+							WorkloadId:     "pod-12",
+							EndpointId:     "endpoint-id-12",
+						}
+						wlEPID3 := proto.WorkloadEndpointID{
+							OrchestratorId: "k8s",
+							WorkloadId:     "pod-13",
+							EndpointId:     "endpoint-id-13",
+						}
+						addEndpoint := func(id *proto.WorkloadEndpointID, name, ipv4, ipv6 string) {
+							epMgr.OnUpdate(&proto.WorkloadEndpointUpdate{
+								Id: id,
+								Endpoint: &proto.WorkloadEndpoint{
+									State:      "active",
+									Mac:        "01:02:03:04:05:06",
+									Name:       name,
+									ProfileIds: []string{},
+									Tiers:      []*proto.TierInfo{},
+									Ipv4Nets:   []string{ipv4},
+									Ipv6Nets:   []string{ipv6},
+								},
+							})
+						}
+						expectDispatchChains := func(names ...string) {
+							for _, name := range names {
+								Expect(filterTable.currentChains).To(HaveKey(name))
+							}
+						}
+
+						JustBeforeEach(func() {
+							filterTable.RemovedChains = set.New()
+							addEndpoint(&wlEPID2, "cali12345-cd", "10.0.240.3/32", "2001:db8:2::3/128")
+							addEndpoint(&wlEPID3, "cali12345-ce", "10.0.240.4/32", "2001:db8:2::4/128")
+							epMgr.CompleteDeferredWork()
+						})
+
+						It("should not remove any chains", func() {
+							Expect(filterTable.RemovedChains.Len()).To(BeZero())
+						})
+
+						It("should have root and child dispatch chains", func() {
+							expectDispatchChains(
+								"cali-to-wl-dispatch",
+								"cali-from-wl-dispatch",
+								"cali-to-wl-dispatch-c",
+								"cali-from-wl-dispatch-c",
+							)
+						})
+
+						Context("with one of the prefix-sharing endpoints removed", func() {
+							JustBeforeEach(func() {
+								filterTable.RemovedChains = set.New()
+								epMgr.OnUpdate(&proto.WorkloadEndpointRemove{
+									Id: &wlEPID3,
+								})
+								epMgr.CompleteDeferredWork()
+							})
+
+							It("should only remove the vanished chains", func() {
+								Expect(filterTable.RemovedChains).To(Equal(set.From(
+									"calitw-cali12345-ce",
+									"califw-cali12345-ce",
+									"cali-to-wl-dispatch-c",
+									"cali-from-wl-dispatch-c",
+								)))
+							})
+
+							It("should still have the root dispatch chains", func() {
+								expectDispatchChains(
+									"cali-to-wl-dispatch",
+									"cali-from-wl-dispatch",
+								)
+							})
+
+							It("should have expected chains", expectWlChainsFor(
+								"cali12345-ab",
+								"cali12345-cd",
+							))
+						})
+					})
+
 					Context("changing the endpoint to another up interface", func() {
 						JustBeforeEach(func() {
+							renderer.numWlDispatchCalcs = 0
 							epMgr.OnUpdate(&ifaceUpdate{
 								Name:  "cali12345-cd",
 								State: "up",
@@ -1036,6 +1166,10 @@ func endpointManagerTests(ipVersion uint8) func() {
 
 						It("should have expected chains", expectWlChainsFor("cali12345-cd"))
 
+						It("should recalculate the dispatch chains", func() {
+							Expect(renderer.numWlDispatchCalcs).To(Equal(1))
+						})
+
 						It("should have removed routes for old iface", func() {
 							routeTable.checkRoutes("cali12345-ab", nil)
 						})
@@ -16,6 +16,7 @@ package intdataplane
 
 import (
 	"reflect"
+	"sync"
 	"time"
 
 	log "github.com/Sirupsen/logrus"
@@ -31,6 +32,18 @@ import (
 	"github.com/projectcalico/felix/set"
 )
 
+const (
+	// msgPeekLimit is the maximum number of messages we'll try to grab from the to-dataplane
+	// channel before we apply the changes.  Higher values allow us to batch up more work on
+	// the channel for greater throughput when we're under load (at cost of higher latency).
+	msgPeekLimit = 100
+
+	// minApplyInterval is the minimum time between dataplane applies.  Updates that arrive
+	// while we're being throttled are coalesced and applied together once the interval
+	// has passed.
+	minApplyInterval = 100 * time.Millisecond
+)
+
 var (
 	countDataplaneSyncErrors = prometheus.NewCounter(prometheus.CounterOpts{
 		Name: "felix_int_dataplane_failures",
@@ -59,8 +72,9 @@ type Config struct {
 
 	MaxIPSetSize int
 
-	IptablesRefreshInterval time.Duration
-	IptablesInsertMode      string
+	IptablesRefreshInterval   time.Duration
+	IptablesInsertMode        string
+	HostInterfacePollInterval time.Duration
 
 	RulesConfig rules.Config
 }
@@ -97,7 +111,11 @@ type InternalDataplane struct {
 	toDataplane   chan interface{}
 	fromDataplane chan interface{}
 
-	allIptablesTables    []*iptables.Table
+	allIptablesTables []*iptables.Table
+	// iptablesTablesByIPVersion contains the same tables as allIptablesTables, grouped by IP
+	// version so that the IP versions can be applied in parallel.
+	iptablesTablesByIPVersion [][]*iptables.Table
+
 	iptablesNATTables    []*iptables.Table
 	iptablesRawTables    []*iptables.Table
 	iptablesFilterTables []*iptables.Table
@@ -138,7 +156,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 		ruleRenderer:      ruleRenderer,
 		interfacePrefixes: config.RulesConfig.WorkloadIfacePrefixes,
 		cleanupPending:    true,
-		ifaceMonitor:      ifacemonitor.New(),
+		ifaceMonitor:      ifacemonitor.New(config.HostInterfacePollInterval),
 		ifaceUpdates:      make(chan *ifaceUpdate, 100),
 		ifaceAddrUpdates:  make(chan *ifaceAddrsUpdate, 100),
 		config:            config,
@@ -147,6 +165,11 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 	dp.ifaceMonitor.Callback = dp.onIfaceStateChange
 	dp.ifaceMonitor.AddrCallback = dp.onIfaceAddrsChange
 
+	// iptables-restore and ip6tables-restore share the xtables lock so, since we apply the IPv4
+	// and IPv6 tables in parallel, we use a lock of our own to make sure that only one of our
+	// tables is running iptables-restore at a time.
+	xtablesLock := &sync.Mutex{}
+
 	natTableV4 := iptables.NewTable(
 		"nat",
 		4,
@@ -154,6 +177,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 		iptables.TableOptions{
 			HistoricChainPrefixes:    rules.AllHistoricChainNamePrefixes,
 			ExtraCleanupRegexPattern: rules.HistoricInsertedNATRuleRegex,
+			XtablesLock:              xtablesLock,
 		},
 	)
 	rawTableV4 := iptables.NewTable(
@@ -162,6 +186,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 		rules.RuleHashPrefix,
 		iptables.TableOptions{
 			HistoricChainPrefixes: rules.AllHistoricChainNamePrefixes,
+			XtablesLock:           xtablesLock,
 		})
 	filterTableV4 := iptables.NewTable(
 		"filter",
@@ -169,6 +194,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 		rules.RuleHashPrefix,
 		iptables.TableOptions{
 			HistoricChainPrefixes: rules.AllHistoricChainNamePrefixes,
+			XtablesLock:           xtablesLock,
 		})
 	ipSetsConfigV4 := config.RulesConfig.IPSetConfigV4
 	ipSetRegV4 := ipsets.NewRegistry(ipSetsConfigV4)
@@ -207,6 +233,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 			iptables.TableOptions{
 				HistoricChainPrefixes:    rules.AllHistoricChainNamePrefixes,
 				ExtraCleanupRegexPattern: rules.HistoricInsertedNATRuleRegex,
+				XtablesLock:              xtablesLock,
 			},
 		)
 		rawTableV6 := iptables.NewTable(
@@ -215,6 +242,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 			rules.RuleHashPrefix,
 			iptables.TableOptions{
 				HistoricChainPrefixes: rules.AllHistoricChainNamePrefixes,
+				XtablesLock:           xtablesLock,
 			},
 		)
 		filterTableV6 := iptables.NewTable(
@@ -223,6 +251,7 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 			rules.RuleHashPrefix,
 			iptables.TableOptions{
 				HistoricChainPrefixes: rules.AllHistoricChainNamePrefixes,
+				XtablesLock:           xtablesLock,
 			},
 		)
 
@@ -259,6 +288,17 @@ func NewIntDataplaneDriver(config Config) *InternalDataplane {
 	for _, t := range dp.iptablesRawTables {
 		dp.allIptablesTables = append(dp.allIptablesTables, t)
 	}
+	for _, ipVersion := range []uint8{4, 6} {
+		var tables []*iptables.Table
+		for _, t := range dp.allIptablesTables {
+			if t.IPVersion == ipVersion {
+				tables = append(tables, t)
+			}
+		}
+		if len(tables) > 0 {
+			dp.iptablesTablesByIPVersion = append(dp.iptablesTablesByIPVersion, tables)
+		}
+	}
 
 	return dp
 }
@@ -397,20 +437,43 @@ func (d *InternalDataplane) loopUpdatingDataplane() {
 		refreshC = refreshTicker.C
 	}
 
+	// throttleC is non-nil after a successful apply, until minApplyInterval has passed.
+	var throttleC <-chan time.Time
+
 	datastoreInSync := false
+	processMsgFromCalcGraph := func(msg interface{}) {
+		log.WithField("msg", msg).Info("Received update from calculation graph")
+		d.recordMsgStat(msg)
+		for _, mgr := range d.allManagers {
+			mgr.OnUpdate(msg)
+		}
+		switch msg.(type) {
+		case *proto.InSync:
+			log.Info("Datastore in sync, flushing the dataplane for the first time...")
+			datastoreInSync = true
+		}
+	}
+
 	for {
 		select {
 		case msg := <-d.toDataplane:
-			log.WithField("msg", msg).Info("Received update from calculation graph")
-			d.recordMsgStat(msg)
-			for _, mgr := range d.allManagers {
-				mgr.OnUpdate(msg)
-			}
-			switch msg.(type) {
-			case *proto.InSync:
-				log.Info("Datastore in sync, flushing the dataplane for the first time...")
-				datastoreInSync = true
+			// Process the message we received, then opportunistically process any other
+			// pending messages so that a burst of updates results in a single apply (and
+			// hence a single iptables-restore per table) rather than one per message.
+			batchSize := 1
+			processMsgFromCalcGraph(msg)
+		msgLoop:
+			for batchSize < msgPeekLimit {
+				select {
+				case msg := <-d.toDataplane:
+					processMsgFromCalcGraph(msg)
+					batchSize++
+				default:
+					// Channel blocked so we must be caught up.
+					break msgLoop
+				}
 			}
+			log.WithField("batchSize", batchSize).Debug("Processed batch of updates")
 			d.dataplaneNeedsSync = true
 		case ifaceUpdate := <-d.ifaceUpdates:
 			log.WithField("msg", ifaceUpdate).Info("Received interface update")
@@ -432,6 +495,14 @@ func (d *InternalDataplane) loopUpdatingDataplane() {
 			d.refreshIptables = true
 			d.dataplaneNeedsSync = true
 		case <-retryTicker.C:
+		case <-throttleC:
+			throttleC = nil
+		}
+
+		if throttleC != nil {
+			// We applied recently; let any further updates accumulate so that they
+			// get applied in one batch when the throttle expires.
+			continue
 		}
 
 		if datastoreInSync && d.dataplaneNeedsSync {
@@ -444,6 +515,10 @@ func (d *InternalDataplane) loopUpdatingDataplane() {
 			}
 			if d.dataplaneNeedsSync {
 				countDataplaneSyncErrors.Inc()
+			} else {
+				// Only throttle after a successful apply; we don't want to retry a
+				// failing update at the throttle rate.
+				throttleC = time.After(minApplyInterval)
 			}
 		}
 	}
@@ -482,10 +557,22 @@ func (d *InternalDataplane) apply() {
 		}
 		d.refreshIptables = false
 	}
-	// Update iptables, this should sever any references to now-unused IP sets.
-	for _, t := range d.allIptablesTables {
-		t.Apply()
+	// Update iptables, this should sever any references to now-unused IP sets.  We calculate
+	// the IPv4 and IPv6 updates in parallel.  The iptables-restore calls themselves are
+	// serialised by the tables' shared xtables lock, since iptables-restore and
+	// ip6tables-restore contend for the same lock file.  Within an IP version, we keep the
+	// tables in order.
+	var wg sync.WaitGroup
+	for _, tables := range d.iptablesTablesByIPVersion {
+		wg.Add(1)
+		go func(tables []*iptables.Table) {
+			defer wg.Done()
+			for _, t := range tables {
+				t.Apply()
+			}
+		}(tables)
 	}
+	wg.Wait()
 
 	// Update the routing table.
 	for _, r := range d.routeTables {
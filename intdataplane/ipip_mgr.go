@@ -42,6 +42,10 @@ type ipipManager struct {
 	// Config for creating/refreshing the IP set.
 	ipSetMetadata ipsets.IPSetMetadata
 
+	// tunnelChangedC is signalled (without blocking) when we see an update to the tunnel
+	// device so that KeepIPIPDeviceInSync can recheck it immediately.
+	tunnelChangedC chan struct{}
+
 	// Dataplane shim.
 	dataplane ipipDataplane
 }
@@ -61,6 +65,7 @@ func newIPIPManagerWithShim(
 	ipipMgr := &ipipManager{
 		ipsetReg:           ipSetReg,
 		activeHostnameToIP: map[string]string{},
+		tunnelChangedC:     make(chan struct{}, 1),
 		dataplane:          dataplane,
 		ipSetMetadata: ipsets.IPSetMetadata{
 			MaxSize: maxIPSetSize,
@@ -72,7 +77,8 @@ func newIPIPManagerWithShim(
 }
 
 // KeepIPIPDeviceInSync is a goroutine that configures the IPIP tunnel device, then periodically
-// checks that it is still correctly configured.
+// checks that it is still correctly configured.  It rechecks immediately if it's told that the
+// tunnel device has changed.
 func (d *ipipManager) KeepIPIPDeviceInSync(mtu int, address net.IP) {
 	log.Info("IPIP thread started.")
 	for {
@@ -82,7 +88,11 @@ func (d *ipipManager) KeepIPIPDeviceInSync(mtu int, address net.IP) {
 			time.Sleep(1 * time.Second)
 			continue
 		}
-		time.Sleep(10 * time.Second)
+		select {
+		case <-d.tunnelChangedC:
+			log.Debug("Tunnel device changed, rechecking its configuration.")
+		case <-time.After(10 * time.Second):
+		}
 	}
 }
 
@@ -130,7 +140,7 @@ func (d *ipipManager) configureIPIPDevice(mtu int, address net.IP) error {
 		logCxt.Info("Set tunnel admin up")
 	}
 
-	if err := d.setLinkAddressV4("tunl0", address); err != nil {
+	if err := d.setLinkAddressV4(link, address); err != nil {
 		log.WithError(err).Warn("Failed to set tunnel device IP")
 		return err
 	}
@@ -138,18 +148,14 @@ func (d *ipipManager) configureIPIPDevice(mtu int, address net.IP) error {
 }
 
 // setLinkAddressV4 updates the given link to set its local IP address.  It removes any other
-// addresses.
-func (d *ipipManager) setLinkAddressV4(linkName string, address net.IP) error {
+// addresses.  The link is passed in, rather than looked up by name, since our caller has
+// already fetched it.
+func (d *ipipManager) setLinkAddressV4(link netlink.Link, address net.IP) error {
 	logCxt := log.WithFields(log.Fields{
-		"link": linkName,
+		"link": link.Attrs().Name,
 		"addr": address,
 	})
 	logCxt.Debug("Setting local IPv4 address on link.")
-	link, err := d.dataplane.LinkByName(linkName)
-	if err != nil {
-		log.WithError(err).WithField("name", linkName).Warning("Failed to get device")
-		return err
-	}
 
 	addrs, err := d.dataplane.AddrList(link, netlink.FAMILY_V4)
 	if err != nil {
@@ -201,6 +207,22 @@ func (d *ipipManager) OnUpdate(msg interface{}) {
 		log.WithField("hostname", msg.Hostname).Debug("Host removed")
 		delete(d.activeHostnameToIP, msg.Hostname)
 		d.ipSetInSync = false
+	case *ifaceUpdate:
+		if msg.Name == "tunl0" {
+			d.onTunnelChanged()
+		}
+	case *ifaceAddrsUpdate:
+		if msg.Name == "tunl0" {
+			d.onTunnelChanged()
+		}
+	}
+}
+
+// onTunnelChanged wakes the KeepIPIPDeviceInSync goroutine, if it isn't already due to wake.
+func (d *ipipManager) onTunnelChanged() {
+	select {
+	case d.tunnelChangedC <- struct{}{}:
+	default:
 	}
 }
 
@@ -160,7 +160,7 @@ var _ = Describe("IpipMgr (tunnel configuration)", func() {
 
 	// Cover the error cases.  We pass the error back up the stack, check that that happens
 	// for all calls.
-	const expNumCalls = 8
+	const expNumCalls = 7
 	It("a successful call should only call into dataplane expected number of times", func() {
 		// This spec is a sanity-check that we've got the expNumCalls constant correct.
 		ipipMgr.configureIPIPDevice(1400, ip)
@@ -195,6 +195,33 @@ var _ = Describe("IpipMgr (tunnel configuration)", func() {
 	}
 })
 
+var _ = Describe("ipipManager tunnel device updates", func() {
+	var ipipMgr *ipipManager
+
+	BeforeEach(func() {
+		ipipMgr = newIPIPManagerWithShim(newMockIPSets(), 1024, &mockIPIPDataplane{})
+	})
+
+	It("should signal a recheck when the tunnel device changes state", func() {
+		ipipMgr.OnUpdate(&ifaceUpdate{Name: "tunl0", State: "down"})
+		Expect(ipipMgr.tunnelChangedC).To(Receive())
+	})
+	It("should signal a recheck when the tunnel device's addresses change", func() {
+		ipipMgr.OnUpdate(&ifaceAddrsUpdate{Name: "tunl0", Addrs: set.New()})
+		Expect(ipipMgr.tunnelChangedC).To(Receive())
+	})
+	It("should coalesce multiple updates without blocking", func() {
+		ipipMgr.OnUpdate(&ifaceUpdate{Name: "tunl0", State: "down"})
+		ipipMgr.OnUpdate(&ifaceUpdate{Name: "tunl0", State: "up"})
+		Expect(ipipMgr.tunnelChangedC).To(Receive())
+		Expect(ipipMgr.tunnelChangedC).NotTo(Receive())
+	})
+	It("should ignore other interfaces", func() {
+		ipipMgr.OnUpdate(&ifaceUpdate{Name: "eth0", State: "down"})
+		Expect(ipipMgr.tunnelChangedC).NotTo(Receive())
+	})
+})
+
 var _ = Describe("ipipManager IP set updates", func() {
 	var (
 		ipipMgr   *ipipManager
@@ -19,6 +19,7 @@ import (
 	. "github.com/onsi/gomega"
 
 	"github.com/projectcalico/felix/iptables"
+	"github.com/projectcalico/felix/set"
 )
 
 type mockTable struct {
@@ -26,6 +27,8 @@ type mockTable struct {
 	currentChains  map[string]*iptables.Chain
 	expectedChains map[string]*iptables.Chain
 	UpdateCalled   bool
+	// RemovedChains records the names of the chains that have been removed.
+	RemovedChains set.Set
 }
 
 func newMockTable(table string) *mockTable {
@@ -33,6 +36,7 @@ func newMockTable(table string) *mockTable {
 		Table:          table,
 		currentChains:  map[string]*iptables.Chain{},
 		expectedChains: map[string]*iptables.Chain{},
+		RemovedChains:  set.New(),
 	}
 }
 
@@ -68,6 +72,7 @@ func (t *mockTable) RemoveChains(chains []*iptables.Chain) {
 }
 
 func (t *mockTable) RemoveChainByName(name string) {
+	t.RemovedChains.Add(name)
 	delete(t.currentChains, name)
 }
 
@@ -143,32 +143,27 @@ func (c V6CIDR) String() string {
 func FromNetIP(netIP net.IP) Addr {
 	if len(netIP) == 4 {
 		ip := V4Addr{}
-		for ii, b := range netIP {
-			ip[ii] = b
-		}
+		copy(ip[:], netIP)
 		return ip
 	} else {
 		ip := V6Addr{}
-		for ii, b := range netIP {
-			ip[ii] = b
-		}
+		copy(ip[:], netIP)
 		return ip
 	}
 }
 
 func CIDRFromIPNet(ipNet calinet.IPNet) CIDR {
 	ones, _ := ipNet.Mask.Size()
-	ip := FromNetIP(ipNet.IP)
-	if ip.Version() == 4 {
-		return V4CIDR{
-			addr:   ip.(V4Addr),
-			prefix: uint8(ones),
-		}
+	// Check the length of the IP directly rather than going via FromNetIP(), which would
+	// box the address in an interface only for us to unbox it again.
+	if len(ipNet.IP) == 4 {
+		cidr := V4CIDR{prefix: uint8(ones)}
+		copy(cidr.addr[:], ipNet.IP)
+		return cidr
 	} else {
-		return V6CIDR{
-			addr:   ip.(V6Addr),
-			prefix: uint8(ones),
-		}
+		cidr := V6CIDR{prefix: uint8(ones)}
+		copy(cidr.addr[:], ipNet.IP)
+		return cidr
 	}
 }
 
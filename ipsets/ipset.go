@@ -230,6 +230,23 @@ func (s *IPSet) flushDeltas() error {
 	return nil
 }
 
+// retryDeltas re-applies the pending deltas after a batched update that included this IP set
+// failed.  "ipset restore" stops at the first failing line but keeps the effect of the lines
+// before it so some of our deltas may already be in the dataplane.  We use -exist so that
+// those aren't treated as failures and only rewrite the IP set if the deltas really don't apply.
+func (s *IPSet) retryDeltas() {
+	var buf bytes.Buffer
+	s.writeDeltas(&buf)
+	if err := s.execIpsetRestore(&buf, "-exist"); err != nil {
+		log.WithError(err).WithField("setID", s.SetID).Warn(
+			"Failed to update IP set, attempting to rewrite it")
+		s.rewritePending = true
+		s.Apply()
+		return
+	}
+	s.clearPendingDeltas()
+}
+
 // rewriteIPSet does a full, atomic, idempotent rewrite of the IP set.
 func (s *IPSet) rewriteIPSet() error {
 	logCxt := log.WithFields(log.Fields{
@@ -259,10 +276,15 @@ func (s *IPSet) rewriteIPSet() error {
 	return nil
 }
 
-func (s *IPSet) execIpsetRestore(stdin io.Reader) error {
+func (s *IPSet) execIpsetRestore(stdin io.Reader, extraArgs ...string) error {
+	return execIpsetRestore(s.newCmd, stdin, extraArgs...)
+}
+
+func execIpsetRestore(newCmd cmdFactory, stdin io.Reader, extraArgs ...string) error {
 	// Execute the commands via the bulk "restore" sub-command.
 	countNumIPSetCalls.Inc()
-	cmd := s.newCmd("ipset", "restore")
+	args := append([]string{"restore"}, extraArgs...)
+	cmd := newCmd("ipset", args...)
 	cmd.SetStdin(stdin)
 	output, err := cmd.CombinedOutput()
 	if err != nil {
@@ -327,6 +349,13 @@ func (s *IPSet) writeFullRewrite(buf stringWriter) {
 // writeDeltas calculates the ipset restore input required to apply the pending adds/deletes to the
 // main IP set.
 func (s *IPSet) writeDeltas(buf stringWriter) {
+	s.writeDeltaLines(buf)
+	buf.WriteString("COMMIT\n")
+}
+
+// writeDeltaLines writes the ipset restore lines for the pending adds/deletes without the
+// trailing COMMIT, allowing the deltas of several IP sets to be combined into one restore.
+func (s *IPSet) writeDeltaLines(buf stringWriter) {
 	mainSetName := s.MainIPSetName()
 	s.pendingDeletions.Iter(func(item interface{}) error {
 		member := item.(string)
@@ -340,7 +369,18 @@ func (s *IPSet) writeDeltas(buf stringWriter) {
 		countNumIPSetLinesExecuted.Inc()
 		return nil
 	})
-	buf.WriteString("COMMIT\n")
+}
+
+// numPendingDeltas returns the number of pending adds/deletes.
+func (s *IPSet) numPendingDeltas() int {
+	return s.pendingAdds.Len() + s.pendingDeletions.Len()
+}
+
+// clearPendingDeltas should be called once the pending deltas have been written to the
+// dataplane by some other means than Apply().
+func (s *IPSet) clearPendingDeltas() {
+	s.pendingDeletions.Clear()
+	s.pendingAdds.Clear()
 }
 
 func (s *IPSet) TempIPSetName() string {
@@ -15,6 +15,7 @@
 package ipsets
 
 import (
+	"bytes"
 	"regexp"
 	"strings"
 
@@ -128,10 +129,60 @@ func (s *Registry) RemoveIPSet(setID string) {
 // ApplyUpdates flushes any updates (or creations) to the dataplane.
 // Separate from ApplyDeletions to allow for proper sequencing with updates to iptables chains.
 func (s *Registry) ApplyUpdates() {
+	// IP sets that need a rewrite are applied individually but, for IP sets that only have
+	// deltas, we write all the deltas with a single "ipset restore" rather than doing one
+	// restore per IP set.
+	var deltaIPSets []*IPSet
 	s.dirtyIPSetIDs.Iter(func(item interface{}) error {
-		s.ipSetIDToActiveIPSet[item.(string)].Apply()
+		ipSet := s.ipSetIDToActiveIPSet[item.(string)]
+		if ipSet.rewritePending {
+			ipSet.Apply()
+		} else if ipSet.numPendingDeltas() > 0 {
+			deltaIPSets = append(deltaIPSets, ipSet)
+		}
 		return set.RemoveItem
 	})
+	if len(deltaIPSets) == 0 {
+		return
+	}
+	if err := s.flushDeltas(deltaIPSets); err != nil {
+		// Fall back to retrying the IP sets one at a time; only the IP sets whose deltas
+		// still fail get rewritten.
+		log.WithError(err).Warn("Failed to apply batched IP set deltas, retrying individually")
+		for _, ipSet := range deltaIPSets {
+			ipSet.retryDeltas()
+		}
+		return
+	}
+	for _, ipSet := range deltaIPSets {
+		ipSet.clearPendingDeltas()
+	}
+}
+
+// flushDeltas writes the pending deltas of all the given IP sets to the dataplane using a single
+// "ipset restore".  We pass -exist so that adds of members that are already present (and deletes
+// of members that are already gone) don't fail the whole batch; the batch only fails if there's
+// a real problem, such as a missing IP set.
+func (s *Registry) flushDeltas(ipSets []*IPSet) error {
+	logCxt := log.WithField("numIPSets", len(ipSets))
+	logCxt.Info("Applying deltas to IP sets")
+
+	var buf bytes.Buffer
+	for _, ipSet := range ipSets {
+		ipSet.writeDeltaLines(&buf)
+	}
+	buf.WriteString("COMMIT\n")
+	if log.GetLevel() >= log.DebugLevel {
+		// Only stringify the buffer if we're debugging.
+		logCxt.WithField("input", buf.String()).Debug("About to apply deltas to IP sets")
+	}
+
+	if err := execIpsetRestore(s.newCmd, &buf, "-exist"); err != nil {
+		return err
+	}
+
+	logCxt.Info("Applied deltas to IP sets")
+	return nil
 }
 
 // ApplyDeletions tries to delete any IP sets that are no longer needed.
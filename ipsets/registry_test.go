@@ -101,6 +101,63 @@ var _ = Describe("IP set registry", func() {
 			v4MainIPSetName: {"10.0.0.1"},
 		})
 	})
+	Describe("with deltas pending for two IP sets", func() {
+		meta2 := meta
+		meta2.SetID = "s:secondIPSet"
+		v4MainIPSetName2 := "cali4-s:secondIPSet"
+
+		BeforeEach(func() {
+			reg.AddOrReplaceIPSet(meta, []string{"10.0.0.1"})
+			reg.AddOrReplaceIPSet(meta2, []string{"10.0.0.2"})
+			reg.ApplyUpdates()
+			dataplane.Cmds = nil
+
+			reg.AddMembers(ipSetID, []string{"10.0.0.3"})
+			reg.RemoveMembers(meta2.SetID, []string{"10.0.0.2"})
+			reg.AddMembers(meta2.SetID, []string{"10.0.0.4"})
+		})
+
+		It("should apply the deltas with a single restore", func() {
+			reg.ApplyUpdates()
+			Expect(dataplane.Cmds).To(HaveLen(1))
+			dataplane.ExpectMembers(map[string][]string{
+				v4MainIPSetName:  {"10.0.0.1", "10.0.0.3"},
+				v4MainIPSetName2: {"10.0.0.4"},
+			})
+		})
+		It("should fall back to individual updates if the batch fails", func() {
+			dataplane.FailNextRestore = true
+			reg.ApplyUpdates()
+			dataplane.ExpectMembers(map[string][]string{
+				v4MainIPSetName:  {"10.0.0.1", "10.0.0.3"},
+				v4MainIPSetName2: {"10.0.0.4"},
+			})
+		})
+		It("should tolerate deltas that are already in the dataplane", func() {
+			dataplane.IPSetMembers[v4MainIPSetName].Add("10.0.0.3")
+			dataplane.SwappedIPSets = set.New()
+			reg.ApplyUpdates()
+			Expect(dataplane.Cmds).To(HaveLen(1))
+			Expect(dataplane.SwappedIPSets.Len()).To(BeZero())
+			dataplane.ExpectMembers(map[string][]string{
+				v4MainIPSetName:  {"10.0.0.1", "10.0.0.3"},
+				v4MainIPSetName2: {"10.0.0.4"},
+			})
+		})
+		It("should only rewrite the IP set whose deltas fail partway through the batch", func() {
+			dataplane.FailDeltasOnIPSet = v4MainIPSetName2
+			dataplane.SwappedIPSets = set.New()
+			reg.ApplyUpdates()
+			Expect(dataplane.SwappedIPSets.Contains(v4MainIPSetName)).To(BeFalse())
+			Expect(dataplane.SwappedIPSets.Contains(v4MainIPSetName2)).To(BeTrue())
+			Expect(dataplane.TriedToAddExistent).To(BeFalse())
+			Expect(dataplane.TriedToDeleteNonExistent).To(BeFalse())
+			dataplane.ExpectMembers(map[string][]string{
+				v4MainIPSetName:  {"10.0.0.1", "10.0.0.3"},
+				v4MainIPSetName2: {"10.0.0.4"},
+			})
+		})
+	})
 	It("remove set before apply should be no-op", func() {
 		// This checks that the dirty flag is set by the remove method.
 		reg.AddOrReplaceIPSet(meta, []string{"10.0.0.1", "10.0.0.2"})
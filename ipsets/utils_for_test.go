@@ -42,6 +42,7 @@ func newMockDataplane() *mockDataplane {
 	return &mockDataplane{
 		IPSetMembers:  make(map[string]set.Set),
 		IPSetMetadata: make(map[string]setMetadata),
+		SwappedIPSets: set.New(),
 	}
 }
 
@@ -52,6 +53,13 @@ type mockDataplane struct {
 	FailNextRestore bool
 	FailAllRestores bool
 	FailNextDestroy bool
+	// FailDeltasOnIPSet, if non-empty, causes any add or del line for the named IP set to
+	// fail.  As with the real ipset restore, lines before the failing one take effect.
+	FailDeltasOnIPSet string
+
+	// SwappedIPSets records the names of the IP sets that have been swapped into place by a
+	// rewrite.
+	SwappedIPSets set.Set
 
 	// Record when various (expected) error cases are hit.
 	TriedToDeleteNonExistent bool
@@ -80,9 +88,16 @@ func (d *mockDataplane) newCmd(name string, arg ...string) CmdIface {
 
 	switch arg[0] {
 	case "restore":
-		Expect(len(arg)).To(Equal(1))
+		exist := false
+		if len(arg) == 2 {
+			Expect(arg[1]).To(Equal("-exist"))
+			exist = true
+		} else {
+			Expect(len(arg)).To(Equal(1))
+		}
 		cmd = &restoreCmd{
 			Dataplane: d,
+			Exist:     exist,
 		}
 	case "destroy":
 		Expect(len(arg)).To(Equal(2))
@@ -111,6 +126,9 @@ type restoreCmd struct {
 	Dataplane *mockDataplane
 	SetName   string
 	Stdin     io.Reader
+	// Exist is true if the -exist flag was passed, which makes adds of existing members and
+	// deletes of missing members into no-ops.
+	Exist bool
 }
 
 func (d *restoreCmd) SetStdin(r io.Reader) {
@@ -200,9 +218,17 @@ func (d *restoreCmd) CombinedOutput() ([]byte, error) {
 			name := parts[1]
 			newMember := parts[2]
 			logCxt := log.WithField("setName", name)
+			if name == d.Dataplane.FailDeltasOnIPSet {
+				logCxt.Warn("Simulating failure of add")
+				return []byte("simulated failure"), &exec.ExitError{}
+			}
 			if currentMembers, ok := d.Dataplane.IPSetMembers[name]; !ok {
 				return []byte("set doesn't exist"), &exec.ExitError{}
 			} else {
+				if currentMembers.Contains(newMember) && d.Exist {
+					logCxt.Info("Add of existing member with -exist, ignoring")
+					continue
+				}
 				if currentMembers.Contains(newMember) {
 					d.Dataplane.TriedToAddExistent = true
 					logCxt.Warn("Add of existing member")
@@ -216,9 +242,17 @@ func (d *restoreCmd) CombinedOutput() ([]byte, error) {
 			name := parts[1]
 			newMember := parts[2]
 			logCxt := log.WithField("setName", name)
+			if name == d.Dataplane.FailDeltasOnIPSet {
+				logCxt.Warn("Simulating failure of del")
+				return []byte("simulated failure"), &exec.ExitError{}
+			}
 			if currentMembers, ok := d.Dataplane.IPSetMembers[name]; !ok {
 				return []byte("set doesn't exist"), &exec.ExitError{}
 			} else {
+				if !currentMembers.Contains(newMember) && d.Exist {
+					logCxt.Info("Delete of missing member with -exist, ignoring")
+					continue
+				}
 				if !currentMembers.Contains(newMember) {
 					d.Dataplane.TriedToDeleteNonExistent = true
 					logCxt.Warn("Delete of non-existent member")
@@ -246,6 +280,7 @@ func (d *restoreCmd) CombinedOutput() ([]byte, error) {
 			} else {
 				d.Dataplane.IPSetMembers[name1] = set2
 				d.Dataplane.IPSetMembers[name2] = set1
+				d.Dataplane.SwappedIPSets.Add(name1)
 
 				meta1 := d.Dataplane.IPSetMetadata[name1]
 				meta2 := d.Dataplane.IPSetMetadata[name2]
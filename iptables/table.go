@@ -20,6 +20,7 @@ import (
 	"reflect"
 	"regexp"
 	"strings"
+	"sync"
 	"time"
 
 	log "github.com/Sirupsen/logrus"
@@ -210,10 +211,17 @@ type Table struct {
 	iptablesRestoreCmd string
 	iptablesSaveCmd    string
 
+	// restoreInputBuffer is reused across calls to applyUpdates() so that we don't need to
+	// regrow a new buffer for each iptables-restore.
+	restoreInputBuffer bytes.Buffer
+
 	// insertMode is either "insert" or "append"; whether we insert our rules or append them
 	// to top-level chains.
 	insertMode string
 
+	// xtablesLock is held while we run iptables-restore.  See TableOptions.XtablesLock.
+	xtablesLock sync.Locker
+
 	logCxt *log.Entry
 
 	gaugeNumChains        prometheus.Gauge
@@ -231,6 +239,13 @@ type TableOptions struct {
 	ExtraCleanupRegexPattern string
 	InsertMode               string
 
+	// XtablesLock, if non-nil, is held while running iptables-restore.  iptables-restore and
+	// ip6tables-restore share the same xtables lock file; newer versions take that lock
+	// themselves and fail immediately, rather than waiting, if it is already held.  Tables that
+	// may be applied concurrently should share the same lock so that we don't race with
+	// ourselves for the lock file.
+	XtablesLock sync.Locker
+
 	// NewCmdOverride for tests, if non-nil, factory to use instead of the real exec.Command()
 	NewCmdOverride cmdFactory
 	// SleepOverride for tests, if non-nil, replacement for time.Sleep()
@@ -289,6 +304,10 @@ func NewTable(
 	if options.SleepOverride != nil {
 		sleep = options.SleepOverride
 	}
+	var xtablesLock sync.Locker = dummyLock{}
+	if options.XtablesLock != nil {
+		xtablesLock = options.XtablesLock
+	}
 
 	table := &Table{
 		Name:                   name,
@@ -307,6 +326,7 @@ func NewTable(
 		ourChainsRegexp:   ourChainsRegexp,
 		oldInsertRegexp:   oldInsertRegexp,
 		insertMode:        insertMode,
+		xtablesLock:       xtablesLock,
 
 		newCmd: newCmd,
 		sleep:  sleep,
@@ -342,11 +362,17 @@ func (t *Table) UpdateChains(chains []*Chain) {
 }
 
 func (t *Table) UpdateChain(chain *Chain) {
-	t.logCxt.WithField("chainName", chain.Name).Info("Queueing update of chain.")
 	oldNumRules := 0
 	if oldChain := t.chainNameToChain[chain.Name]; oldChain != nil {
+		if reflect.DeepEqual(oldChain, chain) {
+			// Chain hasn't changed, avoid marking it dirty, which would force us to
+			// recalculate its hashes on the next Apply().
+			t.logCxt.WithField("chainName", chain.Name).Debug("Chain unchanged, skipping update.")
+			return
+		}
 		oldNumRules = len(oldChain.Rules)
 	}
+	t.logCxt.WithField("chainName", chain.Name).Info("Queueing update of chain.")
 	t.chainNameToChain[chain.Name] = chain
 	numRulesDelta := len(chain.Rules) - oldNumRules
 	t.gaugeNumRules.Add(float64(numRulesDelta))
@@ -508,6 +534,9 @@ func (t *Table) getHashesFromDataplane() map[string][]string {
 // whether written by Felix or not.
 func (t *Table) getHashesFromBuffer(buf *bytes.Buffer) map[string][]string {
 	newHashes := map[string][]string{}
+	// This loop runs for every line of iptables-save output so avoid building per-line log
+	// contexts unless we're actually going to log them.
+	debug := log.GetLevel() >= log.DebugLevel
 	for {
 		// Read the next line of the output.
 		line, err := buf.ReadString('\n')
@@ -517,20 +546,32 @@ func (t *Table) getHashesFromBuffer(buf *bytes.Buffer) map[string][]string {
 
 		// Look for lines of the form ":chain-name - [0:0]", which are forward declarations
 		// for (possibly empty) chains.
-		logCxt := t.logCxt.WithField("line", line)
-		logCxt.Debug("Parsing line")
-		captures := chainCreateRegexp.FindStringSubmatch(line)
+		logCxt := t.logCxt
+		if debug {
+			logCxt = logCxt.WithField("line", line)
+			logCxt.Debug("Parsing line")
+		}
+		// We do a cheap prefix check before running the regexes since most lines are
+		// appends and the regex engine is comparatively expensive.
+		var captures []string
+		if strings.HasPrefix(line, ":") {
+			captures = chainCreateRegexp.FindStringSubmatch(line)
+		}
 		if captures != nil {
 			// Chain forward-reference, make sure the chain exists.
 			chainName := captures[1]
-			logCxt.WithField("chainName", chainName).Debug("Found forward-reference")
+			if debug {
+				logCxt.WithField("chainName", chainName).Debug("Found forward-reference")
+			}
 			newHashes[chainName] = []string{}
 			continue
 		}
 
 		// Look for append lines, such as "-A chain-name -m foo --foo bar"; these are the
 		// actual rules.
-		captures = appendRegexp.FindStringSubmatch(line)
+		if strings.HasPrefix(line, "-A ") {
+			captures = appendRegexp.FindStringSubmatch(line)
+		}
 		if captures == nil {
 			// Skip any non-append lines.
 			logCxt.Debug("Not an append, skipping")
@@ -546,7 +587,9 @@ func (t *Table) getHashesFromBuffer(buf *bytes.Buffer) map[string][]string {
 		captures = t.hashCommentRegexp.FindStringSubmatch(line)
 		if captures != nil {
 			hash = captures[1]
-			logCxt.WithField("hash", hash).Debug("Found hash in rule")
+			if debug {
+				logCxt.WithField("hash", hash).Debug("Found hash in rule")
+			}
 		} else if t.oldInsertRegexp.FindString(line) != "" {
 			logCxt.WithFields(log.Fields{
 				"rule":      line,
@@ -617,7 +660,8 @@ func (t *Table) Apply() {
 }
 
 func (t *Table) applyUpdates() error {
-	var inputBuf bytes.Buffer
+	inputBuf := &t.restoreInputBuffer
+	inputBuf.Reset()
 	// iptables-restore input starts with a line indicating the table name.
 	tableNameLine := fmt.Sprintf("*%s\n", t.Name)
 	inputBuf.WriteString(tableNameLine)
@@ -758,25 +802,29 @@ func (t *Table) applyUpdates() error {
 		// execute iptables-restore.  iptables-restore input ends with a COMMIT.
 		inputBuf.WriteString("COMMIT\n")
 
-		// Annoying to have to copy the buffer here but reading from a buffer is
-		// destructive so if we want to trace out the contents after a failure, we have to
-		// take a copy.
-		input := inputBuf.String()
-		t.logCxt.WithField("iptablesInput", input).Debug("Writing to iptables")
+		if log.GetLevel() >= log.DebugLevel {
+			// Only stringify the buffer if we're debugging.
+			t.logCxt.WithField("iptablesInput", inputBuf.String()).Debug("Writing to iptables")
+		}
 
+		// Feed iptables-restore from a separate reader over the buffer's contents.  Reading
+		// from the buffer itself is destructive and we want to be able to trace out the
+		// input after a failure; this avoids copying the (potentially large) input.
 		var outputBuf, errBuf bytes.Buffer
 		cmd := t.newCmd(t.iptablesRestoreCmd, "--noflush", "--verbose")
-		cmd.SetStdin(&inputBuf)
+		cmd.SetStdin(bytes.NewReader(inputBuf.Bytes()))
 		cmd.SetStdout(&outputBuf)
 		cmd.SetStderr(&errBuf)
 		countNumRestoreCalls.Inc()
+		t.xtablesLock.Lock()
 		err := cmd.Run()
+		t.xtablesLock.Unlock()
 		if err != nil {
 			t.logCxt.WithFields(log.Fields{
 				"output":      outputBuf.String(),
 				"errorOutput": errBuf.String(),
 				"error":       err,
-				"input":       input,
+				"input":       inputBuf.String(),
 			}).Warn("Failed to execute ip(6)tables-restore command")
 			t.inSyncWithDataPlane = false
 			countNumRestoreErrors.Inc()
@@ -801,6 +849,13 @@ func (t *Table) applyUpdates() error {
 	return nil
 }
 
+// dummyLock is a no-op sync.Locker, used when the Table doesn't need to share the xtables lock
+// with any other Table.
+type dummyLock struct{}
+
+func (dummyLock) Lock()   {}
+func (dummyLock) Unlock() {}
+
 func (t *Table) commentFrag(hash string) string {
 	return fmt.Sprintf(`-m comment --comment "%s%s"`, t.hashCommentPrefix, hash)
 }
@@ -86,6 +86,32 @@ var _ = Describe("Table with an empty dataplane", func() {
 		}).To(Panic())
 	})
 
+	It("should hold the xtables lock while running iptables-restore", func() {
+		lock := &recordingLock{}
+		table = NewTable(
+			"filter",
+			4,
+			rules.RuleHashPrefix,
+			TableOptions{
+				HistoricChainPrefixes: rules.AllHistoricChainNamePrefixes,
+				XtablesLock:           lock,
+				NewCmdOverride:        dataplane.newCmd,
+				SleepOverride:         dataplane.sleep,
+			},
+		)
+		lockHeldDuringRestore := false
+		dataplane.OnPreRestore = func() {
+			lockHeldDuringRestore = lock.held
+		}
+		table.SetRuleInsertions("FORWARD", []Rule{
+			{Action: DropAction{}},
+		})
+		table.Apply()
+		Expect(lockHeldDuringRestore).To(BeTrue())
+		Expect(lock.held).To(BeFalse())
+		Expect(lock.numLocks).To(Equal(1))
+	})
+
 	Describe("after inserting a rule", func() {
 		BeforeEach(func() {
 			table.SetRuleInsertions("FORWARD", []Rule{
@@ -726,3 +752,20 @@ func describeDirtyDataplaneTests(appendMode bool) {
 
 var _ = Describe("Table with a dirty datatplane in append mode", func() { describeDirtyDataplaneTests(true) })
 var _ = Describe("Table with a dirty datatplane in insert mode", func() { describeDirtyDataplaneTests(false) })
+
+// recordingLock is a sync.Locker that records whether it is held.
+type recordingLock struct {
+	held     bool
+	numLocks int
+}
+
+func (l *recordingLock) Lock() {
+	Expect(l.held).To(BeFalse(), "Lock() called while lock held")
+	l.held = true
+	l.numLocks++
+}
+
+func (l *recordingLock) Unlock() {
+	Expect(l.held).To(BeTrue(), "Unlock() called while lock not held")
+	l.held = false
+}
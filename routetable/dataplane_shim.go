@@ -16,8 +16,10 @@ package routetable
 
 import (
 	"net"
-	"os/exec"
+	"strings"
+	"syscall"
 
+	log "github.com/Sirupsen/logrus"
 	. "github.com/vishvananda/netlink"
 
 	"github.com/projectcalico/felix/conntrack"
@@ -30,43 +32,126 @@ type dataplaneIface interface {
 	RouteList(link Link, family int) ([]Route, error)
 	RouteAdd(route *Route) error
 	RouteDel(route *Route) error
-	AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, ifaceName string) error
+	AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, link Link) error
 	RemoveConntrackFlows(ipVersion uint8, ipAddr net.IP)
 }
 
+// realDataplane maps through to the netlink package.  It keeps a netlink handle open across
+// calls so that a batch of route updates shares a single netlink socket rather than opening and
+// closing a socket per operation.
 type realDataplane struct {
 	conntrack *conntrack.Conntrack
+	nlHandle  *Handle
 }
 
-func (r realDataplane) LinkList() ([]Link, error) {
-	return LinkList()
+// handle returns the open netlink handle, opening a new one if needed.
+func (r *realDataplane) handle() (*Handle, error) {
+	if r.nlHandle == nil {
+		// Only open a NETLINK_ROUTE socket; that's all we need and, by default, NewHandle()
+		// opens a socket for every netlink family, which fails if any of them is unavailable.
+		h, err := NewHandle(syscall.NETLINK_ROUTE)
+		if err != nil {
+			log.WithError(err).Error("Failed to open netlink handle")
+			return nil, err
+		}
+		r.nlHandle = h
+	}
+	return r.nlHandle, nil
 }
 
-func (r realDataplane) LinkByName(name string) (Link, error) {
-	return LinkByName(name)
+// closeHandleIfErr closes the netlink handle after a failed operation so that we start afresh
+// with a new socket on the next operation, in case the old one is in a bad state.  Errors that
+// the kernel reported in a netlink reply, such as EEXIST or a missing link, don't indicate a
+// problem with the socket so we keep the handle open in those cases.
+func (r *realDataplane) closeHandleIfErr(err error) {
+	if err == nil || r.nlHandle == nil || isNetlinkReplyErr(err) {
+		return
+	}
+	log.WithError(err).Debug("Netlink operation failed, closing netlink handle")
+	r.nlHandle.Delete()
+	r.nlHandle = nil
 }
 
-func (r realDataplane) RouteList(link Link, family int) ([]Route, error) {
-	return RouteList(link, family)
+// isNetlinkReplyErr returns true if err is an error returned by the kernel in a netlink reply,
+// rather than a failure of the socket itself.
+func isNetlinkReplyErr(err error) bool {
+	if _, ok := err.(syscall.Errno); ok {
+		return true
+	}
+	// The netlink library reports a missing link as a plain error rather than an Errno.
+	return strings.Contains(err.Error(), "not found")
 }
 
-func (r realDataplane) RouteAdd(route *Route) error {
-	return RouteAdd(route)
+func (r *realDataplane) LinkList() ([]Link, error) {
+	h, err := r.handle()
+	if err != nil {
+		return nil, err
+	}
+	links, err := h.LinkList()
+	r.closeHandleIfErr(err)
+	return links, err
 }
 
-func (r realDataplane) RouteDel(route *Route) error {
-	return RouteDel(route)
+func (r *realDataplane) LinkByName(name string) (Link, error) {
+	h, err := r.handle()
+	if err != nil {
+		return nil, err
+	}
+	link, err := h.LinkByName(name)
+	r.closeHandleIfErr(err)
+	return link, err
 }
 
-func (r realDataplane) AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, ifaceName string) error {
-	cmd := exec.Command("arp",
-		"-s", cidr.Addr().String(), destMAC.String(),
-		"-i", ifaceName)
-	return cmd.Run()
+func (r *realDataplane) RouteList(link Link, family int) ([]Route, error) {
+	h, err := r.handle()
+	if err != nil {
+		return nil, err
+	}
+	routes, err := h.RouteList(link, family)
+	r.closeHandleIfErr(err)
+	return routes, err
 }
 
-func (r realDataplane) RemoveConntrackFlows(ipVersion uint8, ipAddr net.IP) {
+func (r *realDataplane) RouteAdd(route *Route) error {
+	h, err := r.handle()
+	if err != nil {
+		return err
+	}
+	err = h.RouteAdd(route)
+	r.closeHandleIfErr(err)
+	return err
+}
+
+func (r *realDataplane) RouteDel(route *Route) error {
+	h, err := r.handle()
+	if err != nil {
+		return err
+	}
+	err = h.RouteDel(route)
+	r.closeHandleIfErr(err)
+	return err
+}
+
+func (r *realDataplane) AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, link Link) error {
+	h, err := r.handle()
+	if err != nil {
+		return err
+	}
+	// Program the entry over netlink rather than forking the arp binary once per IP.
+	err = h.NeighSet(&Neigh{
+		Family:       syscall.AF_INET,
+		LinkIndex:    link.Attrs().Index,
+		State:        NUD_PERMANENT,
+		Type:         syscall.RTN_UNICAST,
+		IP:           cidr.Addr().AsNetIP(),
+		HardwareAddr: destMAC,
+	})
+	r.closeHandleIfErr(err)
+	return err
+}
+
+func (r *realDataplane) RemoveConntrackFlows(ipVersion uint8, ipAddr net.IP) {
 	r.conntrack.RemoveConntrackFlows(ipVersion, ipAddr)
 }
 
-var _ dataplaneIface = realDataplane{}
+var _ dataplaneIface = &realDataplane{}
@@ -63,12 +63,12 @@ type RouteTable struct {
 	inSync bool
 
 	// dataplane is our shim for the netlink/arp interface.  In production, it maps directly
-	// through to calls to the netlink package and the arp command.
+	// through to calls to the netlink package.
 	dataplane dataplaneIface
 }
 
 func New(interfacePrefixes []string, ipVersion uint8) *RouteTable {
-	return NewWithShims(interfacePrefixes, ipVersion, realDataplane{conntrack: conntrack.New()})
+	return NewWithShims(interfacePrefixes, ipVersion, &realDataplane{conntrack: conntrack.New()})
 }
 
 // NewWithShims is a test constructor, which allows netlink to be replaced by a shim.
@@ -302,7 +302,7 @@ func (r *RouteTable) syncRoutesForLink(ifaceName string) error {
 		}
 		if r.ipVersion == 4 && target.DestMAC != nil {
 			// TODO(smc) clean up/sync old ARP entries
-			err := r.dataplane.AddStaticArpEntry(cidr, target.DestMAC, ifaceName)
+			err := r.dataplane.AddStaticArpEntry(cidr, target.DestMAC, link)
 			if err != nil {
 				logCxt.WithError(err).Warn("Failed to set ARP entry")
 				updatesFailed = true
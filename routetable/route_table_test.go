@@ -419,14 +419,14 @@ func (d *mockDataplane) RouteDel(route *netlink.Route) error {
 	}
 }
 
-func (d *mockDataplane) AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, ifaceName string) error {
+func (d *mockDataplane) AddStaticArpEntry(cidr ip.CIDR, destMAC net.HardwareAddr, link netlink.Link) error {
 	if d.shouldFail(failNextAddARP) {
 		return simulatedError
 	}
 	log.WithFields(log.Fields{
 		"cidr":      cidr,
 		"destMac":   destMAC,
-		"ifaceName": ifaceName,
+		"ifaceName": link.Attrs().Name,
 	}).Info("Mock dataplane: adding ARP entry")
 	return nil
 }
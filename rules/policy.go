@@ -107,13 +107,17 @@ func (r *DefaultRuleRenderer) ProtoRuleToIptablesRules(pRule *proto.Rule, ipVers
 	return rules
 }
 
+// multiportMaxSlots is iptables' limit on the number of port "slots" in a multiport match.  A
+// single port takes up one slot, a range of ports requires 2.
+const multiportMaxSlots = 15
+
 // SplitPortList splits the input list of ports into groups containing up to 15 port numbers.
 // It always returns at least one (possibly empty) split.
 //
 // The requirement to split into groups of 15, comes from iptables' limit on the number of ports
-// "slots" in a multiport match.  A single port takes up one slot, a range of ports requires 2.
+// "slots" in a multiport match (see multiportMaxSlots).
 func SplitPortList(ports []*proto.PortRange) (splits [][]*proto.PortRange) {
-	slotsAvailableInCurrentSplit := 15
+	slotsAvailableInCurrentSplit := multiportMaxSlots
 	currentSplit := 0
 	splits = append(splits, []*proto.PortRange{})
 	for _, portRange := range ports {
@@ -127,7 +131,7 @@ func SplitPortList(ports []*proto.PortRange) (splits [][]*proto.PortRange) {
 		if slotsAvailableInCurrentSplit < numSlotsRequired {
 			// Adding this port to the current split would take it over the 15 slot
 			// limit, start a new split.
-			slotsAvailableInCurrentSplit = 15
+			slotsAvailableInCurrentSplit = multiportMaxSlots
 			splits = append(splits, []*proto.PortRange{})
 			currentSplit += 1
 		}
@@ -122,6 +122,10 @@ type DefaultRuleRenderer struct {
 
 	dropActions        []iptables.Action
 	inputAcceptActions []iptables.Action
+
+	// metadataDNATRule is the OpenStack metadata DNAT rule, rendered once up front since it
+	// only depends on configuration; nil if the rule is not required.
+	metadataDNATRule *iptables.Rule
 }
 
 func (r *DefaultRuleRenderer) ipSetConfig(ipVersion uint8) *ipsets.IPVersionConfig {
@@ -195,9 +199,25 @@ func NewRenderer(config Config) RuleRenderer {
 		inputAcceptActions = []iptables.Action{iptables.ReturnAction{}}
 	}
 
+	// Third, the OpenStack metadata DNAT rule, which is fixed by configuration.
+	var metadataDNATRule *iptables.Rule
+	if config.OpenStackSpecialCasesEnabled && config.OpenStackMetadataIP != nil {
+		metadataDNATRule = &iptables.Rule{
+			Match: iptables.Match().
+				Protocol("tcp").
+				DestPorts(80).
+				DestNet("169.254.169.254/32"),
+			Action: iptables.DNATAction{
+				DestAddr: config.OpenStackMetadataIP.String(),
+				DestPort: config.OpenStackMetadataPort,
+			},
+		}
+	}
+
 	return &DefaultRuleRenderer{
 		Config:             config,
 		dropActions:        dropActions,
 		inputAcceptActions: inputAcceptActions,
+		metadataDNATRule:   metadataDNATRule,
 	}
 }
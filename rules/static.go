@@ -194,35 +194,37 @@ func (r *DefaultRuleRenderer) filterWorkloadToHostChain(ipVersion uint8) *Chain
 }
 
 func (r *DefaultRuleRenderer) failsafeInChain() *Chain {
-	rules := []Rule{}
-
-	for _, port := range r.Config.FailsafeInboundHostPorts {
-		rules = append(rules, Rule{
-			Match:  Match().Protocol("tcp").DestPorts(port),
-			Action: AcceptAction{},
-		})
-	}
-
 	return &Chain{
 		Name:  ChainFailsafeIn,
-		Rules: rules,
+		Rules: failsafeRules(r.Config.FailsafeInboundHostPorts),
 	}
 }
 
 func (r *DefaultRuleRenderer) failsafeOutChain() *Chain {
-	rules := []Rule{}
+	return &Chain{
+		Name:  ChainFailsafeOut,
+		Rules: failsafeRules(r.Config.FailsafeOutboundHostPorts),
+	}
+}
 
-	for _, port := range r.Config.FailsafeOutboundHostPorts {
+// failsafeRules renders rules that accept TCP traffic to the given ports.  Rather than one rule
+// per port, it packs the ports into multiport matches so that packets traverse as few rules
+// as possible.  Each port takes one multiport slot so we split the ports into groups of
+// multiportMaxSlots.
+func failsafeRules(ports []uint16) []Rule {
+	rules := []Rule{}
+	for len(ports) > 0 {
+		numPorts := len(ports)
+		if numPorts > multiportMaxSlots {
+			numPorts = multiportMaxSlots
+		}
 		rules = append(rules, Rule{
-			Match:  Match().Protocol("tcp").DestPorts(port),
+			Match:  Match().Protocol("tcp").DestPorts(ports[:numPorts]...),
 			Action: AcceptAction{},
 		})
+		ports = ports[numPorts:]
 	}
-
-	return &Chain{
-		Name:  ChainFailsafeOut,
-		Rules: rules,
-	}
+	return rules
 }
 
 func (r *DefaultRuleRenderer) StaticFilterForwardChains() []*Chain {
@@ -372,17 +374,8 @@ func (r *DefaultRuleRenderer) StaticNATPreroutingChains(ipVersion uint8) []*Chai
 		},
 	}
 
-	if ipVersion == 4 && r.OpenStackSpecialCasesEnabled && r.OpenStackMetadataIP != nil {
-		rules = append(rules, Rule{
-			Match: Match().
-				Protocol("tcp").
-				DestPorts(80).
-				DestNet("169.254.169.254/32"),
-			Action: DNATAction{
-				DestAddr: r.OpenStackMetadataIP.String(),
-				DestPort: r.OpenStackMetadataPort,
-			},
-		})
+	if ipVersion == 4 && r.metadataDNATRule != nil {
+		rules = append(rules, *r.metadataDNATRule)
 	}
 
 	return []*Chain{{
@@ -55,16 +55,14 @@ var _ = Describe("Static", func() {
 				expFailsafeIn := &Chain{
 					Name: "cali-failsafe-in",
 					Rules: []Rule{
-						{Match: Match().Protocol("tcp").DestPorts(22), Action: AcceptAction{}},
-						{Match: Match().Protocol("tcp").DestPorts(1022), Action: AcceptAction{}},
+						{Match: Match().Protocol("tcp").DestPorts(22, 1022), Action: AcceptAction{}},
 					},
 				}
 
 				expFailsafeOut := &Chain{
 					Name: "cali-failsafe-out",
 					Rules: []Rule{
-						{Match: Match().Protocol("tcp").DestPorts(23), Action: AcceptAction{}},
-						{Match: Match().Protocol("tcp").DestPorts(1023), Action: AcceptAction{}},
+						{Match: Match().Protocol("tcp").DestPorts(23, 1023), Action: AcceptAction{}},
 					},
 				}
 
@@ -276,6 +274,38 @@ var _ = Describe("Static", func() {
 		})
 	})
 
+	Describe("with more failsafe ports than fit in one multiport match", func() {
+		BeforeEach(func() {
+			config = Config{
+				WorkloadIfacePrefixes:    []string{"cali"},
+				FailsafeInboundHostPorts: []uint16{1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17},
+				IptablesMarkAccept:       0x10,
+				IptablesMarkNextTier:     0x20,
+				IptablesMarkFromWorkload: 0x40,
+			}
+		})
+
+		It("should split the ports into groups of 15", func() {
+			Expect(findChain(rr.StaticFilterTableChains(4), "cali-failsafe-in")).To(Equal(&Chain{
+				Name: "cali-failsafe-in",
+				Rules: []Rule{
+					{
+						Match: Match().Protocol("tcp").
+							DestPorts(1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+						Action: AcceptAction{},
+					},
+					{Match: Match().Protocol("tcp").DestPorts(16, 17), Action: AcceptAction{}},
+				},
+			}))
+		})
+		It("should render an empty chain if there are no ports", func() {
+			Expect(findChain(rr.StaticFilterTableChains(4), "cali-failsafe-out")).To(Equal(&Chain{
+				Name:  "cali-failsafe-out",
+				Rules: []Rule{},
+			}))
+		})
+	})
+
 	Describe("with openstack special-cases", func() {
 		BeforeEach(func() {
 			config = Config{